@@ -1,20 +1,19 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import os
-import math
-import numpy as np
-from PIL import Image, ImageOps  # Added for image resizing
-import graphviz
+import base64
+from concurrent.futures import ThreadPoolExecutor
+# Image sizes, WebP quality and the resize/encode fallback are shared with scripts/preshrink.py
+from slide_images import IMAGES as SLIDE_IMAGES, render_webp, webp_path
+# Heavier libraries (PIL, pic-scale, pyarrow, plotly) are imported inside the functions
+# that use them, so the title slide renders without waiting on them
 
 # -----------------------------------------------------------------------------
 # 1. PAGE CONFIGURATION
 # -----------------------------------------------------------------------------
-icon_image = Image.open("logo.png")
 st.set_page_config(
     page_title="Camden Strategy Framework",
-    page_icon=icon_image,
+    page_icon="logo.png",
     layout="wide",
     initial_sidebar_state="collapsed", # Collapsed gives more room for the presentation
     menu_items={
@@ -37,7 +36,8 @@ THEME = {
     "secondary_text": "#5d6d7e"
 }
 
-st.markdown(f"""
+# Global theme plus title-slide and body-text styling, injected as a single block
+APP_CSS = f"""
     <style>
     /* Import a clean, professional font */
     @import url('https://fonts.googleapis.com/css2?family=Roboto:wght@300;400;700&display=swap');
@@ -86,148 +86,256 @@ st.markdown(f"""
         background-color: {THEME['primary']};
         color: white;
     }}
+
+    /* --- TITLE BOX STYLING --- */
+    .header-box {{
+        background-color: #0e1b3c; /* Camden Navy */
+        padding: 30px;
+        border-radius: 10px;
+        border-left: 12px solid #d92828; /* Red Accent */
+        color: white;
+        text-align: center; /* CHANGED TO CENTER */
+        box-shadow: 0px 6px 10px rgba(0,0,0,0.2);
+        /* Ensure box fills height to match logo visual weight */
+        height: 100%;
+        display: flex;
+        flex-direction: column;
+        justify-content: center;
+        align-items: center; /* Centers items horizontally in flex container */
+    }}
+    
+    /* Large Title Font */
+    .header-title {{
+        font-size: 42px !important;
+        font-weight: 800;
+        font-family: 'Helvetica Neue', 'Arial', sans-serif;
+        margin-bottom: 10px;
+        line-height: 1.1;
+    }}
+    
+    /* Subtitle Font */
+    .header-subtitle {{
+        font-size: 22px !important;
+        font-weight: 400;
+        color: #e0e0e0;
+        margin: 0;
+    }}
+
+    /* --- BODY TEXT STYLING (Make it Bolder) --- */
+    
+    /* Make standard paragraphs darker and heavier */
+    .stMarkdown p {{
+        font-size: 18px !important;
+        font-weight: 500 !important; /* 500 is semi-bold */
+        color: #000000 !important;   /* Pure black for contrast */
+        line-height: 1.6;
+    }}
+    
+    /* Make bullet points darker */
+    .stMarkdown li {{
+        font-size: 18px !important;
+        font-weight: 500 !important;
+        color: #000000 !important;
+    }}
+    
+    /* Make Headers pop */
+    h3 {{
+        font-weight: 800 !important;
+        color: #0e1b3c !important;
+    }}
+    h4 {{
+        font-weight: 700 !important;
+        color: #d92828 !important; /* Red accent for smaller headers */
+    }}
     </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(APP_CSS, unsafe_allow_html=True)
 
 # -----------------------------------------------------------------------------
 # 3. HELPER FUNCTIONS & DATA LOADING
 # -----------------------------------------------------------------------------
 
+@st.cache_resource(show_spinner=False)
 def check_system_integrity():
     """
     Verifies that all critical assets (Data and Images) are present.
     Stops execution with a polished error message if critical data is missing.
+    Cached per process; the warning is replayed on later runs, and a failed check is never cached.
     """
     # Required assets
     required_images = [f"{i}.png" for i in range(1, 9)] # Added 8.png for logo
     required_data = ["data.csv"]
+
+    # One directory listing instead of a stat call per file
+    present = frozenset(entry.name for entry in os.scandir("."))
     
     # Check Data (Critical)
-    missing_data = [f for f in required_data if not os.path.exists(f)]
+    missing_data = [f for f in required_data if f not in present]
     if missing_data:
         st.error(f"⛔ **CRITICAL ERROR: System Data Missing**\n\nThe following core files could not be found: `{', '.join(missing_data)}`")
         st.stop()
 
     # Check Images (Non-critical, but warn)
-    missing_images = [f for f in required_images if not os.path.exists(f)]
+    missing_images = [f for f in required_images if f not in present]
     if missing_images:
         st.warning(f"⚠️ **Asset Warning:** Some visual assets are missing: `{', '.join(missing_images)}`. Placeholders will be used.")
 
 # Run integrity check immediately
 check_system_integrity()
 
-@st.cache_resource
-def load_and_resize_image(image_path, size=(600, 400)):
+def get_mtime(file_path):
+    """
+    Returns the last-modified time of a file, or None if it is missing.
+    Used as part of cache keys so edited assets are picked up automatically.
+    """
+    try:
+        return os.path.getmtime(file_path)
+    except OSError:
+        return None
+
+def prepare_image_bytes(image_path, png_mtime, webp_mtime):
+    """
+    Returns display-ready WebP bytes for one slide image.
+    Prefers the copy written by scripts/preshrink.py, which is sent as-is, unless it is
+    older than the PNG; otherwise renders the PNG the same way the script does.
+    Makes no Streamlit calls, so it is safe to run in a worker thread.
+    """
+    if webp_mtime is not None and (png_mtime is None or webp_mtime >= png_mtime):
+        with open(webp_path(image_path), "rb") as f:
+            return f.read()
+    # One resize thread per image: the slide images are already prepared in a thread pool
+    return render_webp(image_path, workers=1)
+
+def slide_image_mtimes():
     """
-    Loads, resizes, and caches an image.
-    Returns None if image is not found, preventing crashes.
+    Modification times of every slide image and its WebP copy, used as a cache key.
+    Read from one directory listing instead of two getmtime calls per image.
     """
-    if os.path.exists(image_path):
+    wanted = {*SLIDE_IMAGES, *map(webp_path, SLIDE_IMAGES)}
+    mtimes = {entry.name: entry.stat().st_mtime for entry in os.scandir(".") if entry.name in wanted}
+    return tuple((mtimes.get(path), mtimes.get(webp_path(path))) for path in SLIDE_IMAGES)
+
+# Only the newest set of images is kept, so editing assets does not pile up old dicts
+@st.cache_resource(show_spinner=False, max_entries=1)
+def load_slide_images(mtimes):
+    """
+    Loads every image in SLIDE_IMAGES once per process, keyed by PNG name.
+    The title logo, sections 4-6 and the section 6 header icon index into this dict
+    instead of reading the image files on each rerun.
+    Values are WebP data URLs: st.image re-encodes raw bytes to PNG or JPEG on every call,
+    but passes data URLs to the browser unchanged, so the small WebP is what gets sent.
+    `mtimes` comes from slide_image_mtimes, so replacing a file rebuilds the dict, and a
+    PNG newer than its WebP copy is re-rendered instead of serving the stale copy.
+    """
+    # Decode/resize in parallel; Pillow and pic-scale release the GIL while working
+    with ThreadPoolExecutor(max_workers=len(SLIDE_IMAGES)) as pool:
+        futures = {
+            path: pool.submit(prepare_image_bytes, path, png_mtime, webp_mtime)
+            for path, (png_mtime, webp_mtime) in zip(SLIDE_IMAGES, mtimes)
+        }
+
+    images = {}
+    for path, future in futures.items():
         try:
-            img = Image.open(image_path)
-            # High-quality resampling for professional look
-            img = ImageOps.fit(img, size, Image.Resampling.LANCZOS) 
-            return img
+            data = future.result()
         except Exception as e:
-            st.error(f"Error loading image {image_path}: {e}")
-            return None
-    return None
+            st.error(f"Error loading image {path}: {e}")
+            data = None
+        images[path] = f"data:image/webp;base64,{base64.b64encode(data).decode()}" if data else None
+    return images
 
-@st.cache_data
-def load_data():
+@st.cache_resource(show_spinner=False)
+def camden_plotly_template():
+    """
+    Registers the shared "camden" Plotly template once per process and returns the
+    template name to pass to charts (Plotly's default look with the Camden fonts on top).
+    """
+    import plotly.graph_objects as go
+    import plotly.io as pio
+
+    pio.templates["camden"] = go.layout.Template(
+        layout=dict(
+            font=dict(family="Arial", size=14, color="black"),
+            bargap=0.15, # Thicker bars across all bar charts
+            xaxis=dict(tickfont=dict(size=14, family="Arial Black")),
+        ),
+        data=dict(bar=[go.Bar(textfont=dict(family="Arial Black"))]),
+    )
+    return "plotly+camden"
+
+# Categoricals group and filter on integer codes; int32 halves the Count column
+INCIDENT_DTYPES = {"Location": "category", "Category": "category", "Count": "int32"}
+
+def data_file_mtimes():
+    """Modification times of data.csv and data.parquet, used as the data cache key."""
+    return get_mtime("data.csv"), get_mtime("data.parquet")
+
+@st.cache_data(persist="disk")
+def load_data(data_mtimes):
     """
     Loads the dataset with error handling.
+    Prefers data.parquet (written by scripts/csv_to_parquet.py), whose dictionary-encoded
+    columns load straight into categoricals, as long as it is not older than data.csv.
+    Otherwise parses data.csv with the PyArrow CSV engine, so an edited CSV is never
+    shadowed by a stale Parquet copy. Either way the columns end up as INCIDENT_DTYPES.
+    The result persists across restarts; `data_mtimes` (from data_file_mtimes) is part
+    of the cache key, so editing either data file reloads it.
     """
+    csv_mtime, parquet_mtime = data_mtimes
+    parquet_error = None
+    if parquet_mtime is not None and (csv_mtime is None or parquet_mtime >= csv_mtime):
+        try:
+            import pyarrow.parquet as pq
+            table = pq.read_table("data.parquet", columns=list(INCIDENT_DTYPES))
+            # No-op for a Parquet file written by the script; coerces one written any other way
+            return table.to_pandas().astype(INCIDENT_DTYPES)
+        except Exception as e:
+            # data.csv is the source of truth, so an unreadable Parquet copy only costs speed
+            parquet_error = e
     try:
-        df = pd.read_csv("data.csv")
+        df = pd.read_csv("data.csv", engine="pyarrow", dtype=INCIDENT_DTYPES)
         # Optional: Convert standard date columns if they exist to datetime objects
         # if 'date' in df.columns:
         #     df['date'] = pd.to_datetime(df['date'])
         return df
     except Exception as e:
-        st.error(f"⛔ **Data Load Error:** Could not read `data.csv`. \n\nError details: {e}")
+        details = f"`data.csv`: {e}"
+        if parquet_error is not None:
+            details = f"`data.parquet`: {parquet_error}  \n{details}"
+        st.error(f"⛔ **Data Load Error:** Could not read the incident data. \n\nError details:  \n{details}")
         st.stop()
 
+@st.cache_data(show_spinner=False)
+def top20_incidents(data_mtimes):
+    """
+    Finds the 20 locations with the most incidents and filters the data to them.
+    Returns (top_locations, filtered_df, total_count), with locations ordered smallest to largest.
+    Keyed on the data file mtimes rather than the DataFrame, so the cache lookup never hashes it.
+    """
+    df = load_data(data_mtimes)
+    # nlargest uses a heap instead of a full sort; the groupby key order is unused
+    location_totals = df.groupby("Location", observed=True, sort=False)["Count"].sum().nlargest(20)
+    top_locations = location_totals.index.tolist()[::-1]
+    return top_locations, df[df["Location"].isin(top_locations)], int(df["Count"].sum())
+
 # Load data into session
-df_incidents = load_data()
+data_mtimes = data_file_mtimes()
+df_incidents = load_data(data_mtimes)
+top_locations, df_top_incidents, total_incidents = top20_incidents(data_mtimes)
+imgs = load_slide_images(slide_image_mtimes())
 
 
 # -----------------------------------------------------------------------------
 # 3. TITLE SLIDE - OPTIMIZED LAYOUT
 # -----------------------------------------------------------------------------
 
-# 1. Custom CSS for Bolder Text and Title Box
-st.markdown("""
-    <style>
-    /* --- TITLE BOX STYLING --- */
-    .header-box {
-        background-color: #0e1b3c; /* Camden Navy */
-        padding: 30px;
-        border-radius: 10px;
-        border-left: 12px solid #d92828; /* Red Accent */
-        color: white;
-        text-align: center; /* CHANGED TO CENTER */
-        box-shadow: 0px 6px 10px rgba(0,0,0,0.2);
-        /* Ensure box fills height to match logo visual weight */
-        height: 100%;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-        align-items: center; /* Centers items horizontally in flex container */
-    }
-    
-    /* Large Title Font */
-    .header-title {
-        font-size: 42px !important;
-        font-weight: 800;
-        font-family: 'Helvetica Neue', 'Arial', sans-serif;
-        margin-bottom: 10px;
-        line-height: 1.1;
-    }
-    
-    /* Subtitle Font */
-    .header-subtitle {
-        font-size: 22px !important;
-        font-weight: 400;
-        color: #e0e0e0;
-        margin: 0;
-    }
-
-    /* --- BODY TEXT STYLING (Make it Bolder) --- */
-    
-    /* Make standard paragraphs darker and heavier */
-    .stMarkdown p {
-        font-size: 18px !important;
-        font-weight: 500 !important; /* 500 is semi-bold */
-        color: #000000 !important;   /* Pure black for contrast */
-        line-height: 1.6;
-    }
-    
-    /* Make bullet points darker */
-    .stMarkdown li {
-        font-size: 18px !important;
-        font-weight: 500 !important;
-        color: #000000 !important;
-    }
-    
-    /* Make Headers pop */
-    h3 {
-        font-weight: 800 !important;
-        color: #0e1b3c !important;
-    }
-    h4 {
-        font-weight: 700 !important;
-        color: #d92828 !important; /* Red accent for smaller headers */
-    }
-    </style>
-""", unsafe_allow_html=True)
-
-# 2. Create the Layout [1, 3]
+# 1. Create the Layout [1, 3]
 col_logo, col_title = st.columns([1, 3], gap="medium", vertical_alignment="center")
 
 with col_logo:
-    # Replace "8.png" with your actual image path
-    st.image("8.png", use_container_width=True)
+    if imgs["8.png"]:
+        st.image(imgs["8.png"], use_container_width=True)
 
 with col_title:
     st.markdown("""
@@ -243,11 +351,11 @@ st.markdown("---")
 # -----------------------------------------------------------------------------
 # NEW SECTION: STRATEGIC CONTEXT (Formatted Professional Text)
 # -----------------------------------------------------------------------------
-st.subheader("📌 Strategic Context & Rationale")
-
-# Intro Paragraph (Full Width)
-st.write(
+# Heading + Intro Paragraph (Full Width), sent as a single element
+st.markdown(
     """
+    ### 📌 Strategic Context & Rationale
+
     Camden has a significant opportunity to set a positive example among London boroughs by tackling a challenge 
     that requires not only local action but also the attention of central government and the Mayor of London. 
     **Current police data consistently ranks Camden among the highest boroughs for drug-related activity**, 
@@ -297,8 +405,7 @@ st.caption("Please refer to the accompanying map and station-area analysis for f
 # -----------------------------------------------------------------------------
 # 3. Executive Summary Content (Existing)
 # -----------------------------------------------------------------------------
-st.markdown("---")
-st.subheader("📋 Executive Summary")
+st.markdown("---\n\n### 📋 Executive Summary")
 
 col1, col2 = st.columns(2, gap="large")
 
@@ -341,115 +448,129 @@ st.markdown("---")
 # -----------------------------------------------------------------------------
 st.header("📍 The Critical Transport Triangle")
 
-# Layout: Map on the left, Details on the right
-col_map, col_info = st.columns([1.2, 1])
+# Station details, rendered by one data-driven block instead of an if/elif chain
+STATIONS = {
+    "St Pancras International": {
+        "img": "1.png",
+        "usage": "35,959,980",
+        "delta": "High Volume",
+        "growth_chart": False,
+        "info": "International trains: It’s the London terminal for the Eurostar, which runs high-speed trains to Paris, Brussels, Amsterdam, and other destinations in Europe.",
+    },
+    "Kings Cross Station": {
+        "img": "2.png",
+        "usage": "24,483,824",
+        "delta": "Major Interchange",
+        "growth_chart": False,
+        "info": "Major UK rail hub: Trains from King’s Cross go mainly to the north and east of England, including: York, Newcastle, Leeds, Edinburgh (Scotland), and Other destinations along the East Coast Main Line.",
+    },
+    "Camden Town Station": {
+        "img": "3.png",
+        "usage": None,  # Shown as a growth chart instead of a single metric
+        "delta": None,
+        "growth_chart": True,
+        "info": "Major UK rail hub: Trains from King’s Cross go mainly to the north and east of England, including: York, Newcastle, Leeds, Edinburgh (Scotland), and Other destinations along the East Coast Main Line.",
+    },
+}
 
-with col_map:
-    st.image("5.png", use_container_width=True, caption="Map of Key Transport Hubs")
-    st.caption("👇 Select a station to view passenger statistics and details.")
-    
-    # Interactive selection
-    station_selector = st.radio(
-        "Select Location to Inspect:",
-        ["St Pancras International", "Kings Cross Station", "Camden Town Station"],
-        horizontal=True
+@st.cache_data(show_spinner=False)
+def build_growth_fig():
+    """
+    Builds the Camden Town passenger growth chart (blue/yellow/red segments).
+    The figure is static, so it is built once and reused on every station switch.
+    """
+    # Plotly is imported where it is used to keep it off the cold-start path
+    import plotly.graph_objects as go
+
+    fig_growth = go.Figure()
+
+    # 1. Blue Segment (2020 to 2021)
+    fig_growth.add_trace(go.Scatter(
+        x=["2020", "2021"],
+        y=[5.51, 9.12],
+        mode='lines+markers',
+        fill='tozeroy',  # Fills area to x-axis
+        line=dict(color='#1f77b4', width=3), # Blue
+        name="Recovery"
+    ))
+
+    # 2. Yellow Segment (2021 to 2022)
+    fig_growth.add_trace(go.Scatter(
+        x=["2021", "2022"],
+        y=[9.12, 17.34],
+        mode='lines+markers',
+        fill='tozeroy',
+        line=dict(color='#f1c40f', width=3), # Warning Yellow
+        name="Growth"
+    ))
+
+    # 3. Red Segment (2022 to 2023)
+    fig_growth.add_trace(go.Scatter(
+        x=["2022", "2023"],
+        y=[17.34, 18.81],
+        mode='lines+markers',
+        fill='tozeroy',
+        line=dict(color='#d92828', width=3), # Danger Red
+        name="High Traffic"
+    ))
+
+    # Update Layout to lock X-Axis and styling
+    fig_growth.update_layout(
+        title="📈 Explosive Passenger Growth",
+        height=300,
+        margin=dict(l=0, r=0, t=30, b=0),
+        showlegend=False, # Hide legend to keep it clean
+        xaxis=dict(
+            tickmode='array', # Forces Plotly to use only the ticks we provide
+            tickvals=["2020", "2021", "2022", "2023"], # Exact labels
+            showgrid=False
+        ),
+        yaxis=dict(
+            title="Passengers (Millions)",
+            showgrid=True,
+            gridcolor='#f0f0f0'
+        )
     )
 
-with col_info:
-    st.markdown(f"### {station_selector}")
-    
-    if station_selector == "St Pancras International":
-        st.image("1.png", use_container_width=True)
-        st.metric(label="Yearly Usage", value="35,959,980", delta="High Volume")
-        st.info("International trains: It’s the London terminal for the Eurostar, which runs high-speed trains to Paris, Brussels, Amsterdam, and other destinations in Europe.")
-
-    elif station_selector == "Kings Cross Station":
-        st.image("2.png", use_container_width=True)
-        st.metric(label="Yearly Usage", value="24,483,824", delta="Major Interchange")
-        st.info("Major UK rail hub: Trains from King’s Cross go mainly to the north and east of England, including: York, Newcastle, Leeds, Edinburgh (Scotland), and Other destinations along the East Coast Main Line.")
-
-#     elif station_selector == "Camden Town Station":
-#         st.image("3.png", use_container_width=True)
-        
-#         # Growth Chart Data
-#         growth_data = pd.DataFrame({
-#             "Year": ["2020", "2021", "2022", "2023"],
-#             "Passengers (Millions)": [5.51, 9.12, 17.34, 18.81]
-#         })
-        
-#         # Area Chart for Growth
-#         fig_growth = px.area(
-#             growth_data, 
-#             x="Year", 
-#             y="Passengers (Millions)", 
-#             title="📈 Explosive Passenger Growth",
-#             markers=True,
-#             color_discrete_sequence=['#1f77b4']  # Standard Blue
-#         )
-#         fig_growth.update_layout(height=300, margin=dict(l=0, r=0, t=30, b=0))
-#         st.plotly_chart(fig_growth, use_container_width=True)
-#         st.info("Major UK rail hub: Trains from King’s Cross go mainly to the north and east of England, including: York, Newcastle, Leeds, Edinburgh (Scotland), and Other destinations along the East Coast Main Line.")
-# st.markdown("---")
-    elif station_selector == "Camden Town Station":
-        st.image("3.png", use_container_width=True)
-        
-        # --- CUSTOM COLORED CHART LOGIC ---
-        
-        fig_growth = go.Figure()
-
-        # 1. Blue Segment (2020 to 2021)
-        fig_growth.add_trace(go.Scatter(
-            x=["2020", "2021"],
-            y=[5.51, 9.12],
-            mode='lines+markers',
-            fill='tozeroy',  # Fills area to x-axis
-            line=dict(color='#1f77b4', width=3), # Blue
-            name="Recovery"
-        ))
-
-        # 2. Yellow Segment (2021 to 2022)
-        fig_growth.add_trace(go.Scatter(
-            x=["2021", "2022"],
-            y=[9.12, 17.34],
-            mode='lines+markers',
-            fill='tozeroy',
-            line=dict(color='#f1c40f', width=3), # Warning Yellow
-            name="Growth"
-        ))
-
-        # 3. Red Segment (2022 to 2023)
-        fig_growth.add_trace(go.Scatter(
-            x=["2022", "2023"],
-            y=[17.34, 18.81],
-            mode='lines+markers',
-            fill='tozeroy',
-            line=dict(color='#d92828', width=3), # Danger Red
-            name="High Traffic"
-        ))
-
-        # Update Layout to lock X-Axis and styling
-        fig_growth.update_layout(
-            title="📈 Explosive Passenger Growth",
-            height=300,
-            margin=dict(l=0, r=0, t=30, b=0),
-            showlegend=False, # Hide legend to keep it clean
-            xaxis=dict(
-                tickmode='array', # Forces Plotly to use only the ticks we provide
-                tickvals=["2020", "2021", "2022", "2023"], # Exact labels
-                showgrid=False
-            ),
-            yaxis=dict(
-                title="Passengers (Millions)",
-                showgrid=True,
-                gridcolor='#f0f0f0'
-            )
+    return fig_growth
+
+@st.fragment
+def station_panel():
+    """
+    Station map, selector and detail panel.
+    Runs as a fragment so switching stations only reruns this section.
+    """
+    # Layout: Map on the left, Details on the right
+    col_map, col_info = st.columns([1.2, 1])
+
+    with col_map:
+        if imgs["5.png"]:
+            st.image(imgs["5.png"], use_container_width=True, caption="Map of Key Transport Hubs")
+        st.caption("👇 Select a station to view passenger statistics and details.")
+
+        # Interactive selection
+        station_selector = st.radio(
+            "Select Location to Inspect:",
+            list(STATIONS),
+            horizontal=True
         )
 
-        st.plotly_chart(fig_growth, use_container_width=True)
-        
-        st.info("Major UK rail hub: Trains from King’s Cross go mainly to the north and east of England, including: York, Newcastle, Leeds, Edinburgh (Scotland), and Other destinations along the East Coast Main Line.")
+    with col_info:
+        st.markdown(f"### {station_selector}")
+
+        cfg = STATIONS[station_selector]
+        if imgs[cfg["img"]]:
+            st.image(imgs[cfg["img"]], use_container_width=True)
+        if cfg["usage"]:
+            st.metric(label="Yearly Usage", value=cfg["usage"], delta=cfg["delta"])
+        if cfg["growth_chart"]:
+            # --- CUSTOM COLORED CHART LOGIC ---
+            st.plotly_chart(build_growth_fig(), use_container_width=True, key="growth_fig")
+        st.info(cfg["info"])
 
-    st.markdown("---")
+        st.markdown("---")
+
+station_panel()
 # -----------------------------------------------------------------------------
 # 5. MARKET CONTEXT
 # -----------------------------------------------------------------------------
@@ -458,7 +579,8 @@ st.header("🛍️ Inverness Street Market")
 col_mkt_img, col_mkt_text = st.columns([1, 1])
 
 with col_mkt_img:
-    st.image("4.png", use_container_width=True, caption="Inverness Street Market")
+    if imgs["4.png"]:
+        st.image(imgs["4.png"], use_container_width=True, caption="Inverness Street Market")
 
 with col_mkt_text:
     st.markdown("#### The Commerce-Crime Nexus")
@@ -473,49 +595,25 @@ st.markdown("---")
 # -----------------------------------------------------------------------------
 # 6. EVIDENCE & POLICING CHALLENGES
 # -----------------------------------------------------------------------------
-import base64
-
-# Function to load image and convert to base64 so it can be used in HTML
-def get_img_as_base64(file_path):
-    with open(file_path, "rb") as f:
-        data = f.read()
-    return base64.b64encode(data).decode()
-
-# 1. Convert your image
-img_str = get_img_as_base64("ju.png")
-
-# 2. Render Header with Inline Image
-st.markdown(f"""
+# 1. Inline the icon in HTML
+# imgs holds it as a 120px WebP data URL, loaded once per process with the slide images
+icon_src = imgs["ju.png"] or ""
+evidence_header = f"""
     <h2 style="display: flex; align-items: center;">
-        <img src="data:image/png;base64,{img_str}" 
+        <img src="{icon_src}" 
              style="width: 40px; height: 40px; margin-right: 10px; border-radius: 5px;">
         The Evidence Challenge
     </h2>
-    """, unsafe_allow_html=True)
-
-col_cctv, col_find = st.columns(2)
-import base64
-
-# Function to load image and convert to base64 so it can be used in HTML
-def get_img_as_base64(file_path):
-    with open(file_path, "rb") as f:
-        data = f.read()
-    return base64.b64encode(data).decode()
+    """
 
-# 1. Convert your image
-img_str = get_img_as_base64("ju.png")
+# 2. Render Header with Inline Image
+st.markdown(evidence_header, unsafe_allow_html=True)
 
+col_cctv, col_find = st.columns(2)
 # 2. Render Header with Inline Image
-st.markdown(f"""
-    <h2 style="display: flex; align-items: center;">
-        <img src="data:image/png;base64,{img_str}" 
-             style="width: 40px; height: 40px; margin-right: 10px; border-radius: 5px;">
-        The Evidence Challenge
-    </h2>
-    """, unsafe_allow_html=True)
-# Using the resize function to ensure images match perfectly in height/aspect
-img_exchange = load_and_resize_image("6.png")
-img_drugs = load_and_resize_image("7.png")
+st.markdown(evidence_header, unsafe_allow_html=True)
+img_exchange = imgs["6.png"]
+img_drugs = imgs["7.png"]
 
 with col_cctv:
     st.subheader("1. The Requirement")
@@ -543,11 +641,17 @@ st.markdown("---")
 st.header("💷 Economic Scale: Legal Imports vs. Illicit Market")
 
 # Initialize session state for the reveal button if not present
-if 'reveal_drug_market' not in st.session_state:
-    st.session_state['reveal_drug_market'] = False
+st.session_state.setdefault('reveal_drug_market', False)
+
+def set_drug_market_reveal(reveal):
+    """
+    Button callback: runs before the next script run, so the chart picks up the new state
+    without an extra st.rerun().
+    """
+    st.session_state['reveal_drug_market'] = reveal
 
 # Base Data (Legal Commodities)
-import_data = [
+IMPORT_DATA = [
     {"Commodity": "Mineral Fuels", "Value": 8.7, "Type": "Legal"},
     {"Commodity": "Mechanical Appliances", "Value": 6.4, "Type": "Legal"},
     {"Commodity": "Electronic Equipment", "Value": 5.3, "Type": "Legal"},
@@ -560,89 +664,113 @@ import_data = [
     {"Commodity": "Knitwear", "Value": 1.3, "Type": "Legal"}
 ]
 
-df_imports = pd.DataFrame(import_data)
-
-# 1. Handle Reveal Logic
-if st.session_state['reveal_drug_market']:
-    # Add Illicit Drugs to DataFrame
-    new_row = pd.DataFrame([{"Commodity": "Illicit Drugs", "Value": 9.4, "Type": "Illegal"}])
-    df_imports = pd.concat([df_imports, new_row], ignore_index=True)
-
-# 2. Sort by Value Descending (Highest on Left)
-df_imports = df_imports.sort_values("Value", ascending=False)
-
-# Define Colors
-colors = {"Legal": "#1f77b4", "Illegal": "#DC3912"}
-
-# 3. Build Chart (Vertical)
-# Note: We swapped x and y. x is now Commodity, y is Value.
-fig_imports = px.bar(
-    df_imports,
-    x="Commodity", 
-    y="Value", 
-    color="Type", 
-    color_discrete_map=colors, 
-    text="Value",
-    title="<b>Top UK Commodities vs. Illicit Drugs Market (£ Billions)</b>",
-)
+# Revealed on demand by the button below
+ILLICIT_DRUGS_ROW = {"Commodity": "Illicit Drugs", "Value": 9.4, "Type": "Illegal"}
 
-# 4. Apply Styling (Thicker, Bolder, Larger)
-fig_imports.update_layout(
-    showlegend=False, 
-    height=600, # Increased height for vertical breathing room
-    bargap=0.15, # <--- This makes columns THICKER by reducing the gap between them
-    
-    # Global Font Settings
-    font=dict(
-        family="Arial, sans-serif",
-        size=14,  # Base font size increased
-        color="black"
-    ),
-    
-    # X-Axis Styling (The Categories)
-    xaxis=dict(
-        title=None,
-        tickfont=dict(
-            size=14, 
-            family="Arial Black" # Bold font for labels
+@st.cache_resource(show_spinner=False)
+def get_imports_table():
+    """
+    Builds the full imports table (including Illicit Drugs) once per process,
+    sorted by Value Descending (Highest on Left).
+    The frame is shared, so treat it as read-only.
+    """
+    df_imports = pd.DataFrame(IMPORT_DATA + [ILLICIT_DRUGS_ROW])
+    return df_imports.sort_values("Value", ascending=False, kind="stable")
+
+@st.cache_data(show_spinner=False)
+def build_imports_fig(reveal):
+    """
+    Builds the imports vs. illicit market bar chart.
+    Cached per reveal state, so reruns reuse the finished figure.
+    """
+    import plotly.graph_objects as go
+
+    # 1. Handle Reveal Logic (Illicit Drugs row included only when revealed)
+    df_imports = get_imports_table()
+    if not reveal:
+        df_imports = df_imports[df_imports["Type"] != "Illegal"]
+
+    # Define Colors
+    colors = {"Legal": "#1f77b4", "Illegal": "#DC3912"}
+
+    # 2. Build Chart (Vertical)
+    # A single go.Bar trace from plain lists skips Plotly Express' DataFrame pipeline
+    fig_imports = go.Figure(go.Bar(
+        x=df_imports["Commodity"].tolist(),
+        y=df_imports["Value"].tolist(),
+        marker_color=df_imports["Type"].map(colors).tolist(),
+        text=df_imports["Value"].tolist(),
+    ))
+
+    # 3. Apply Styling (Thicker, Bolder, Larger)
+    # Fonts, bar gap and bold tick labels come from the shared template
+    fig_imports.update_layout(
+        template=camden_plotly_template(),
+        title="<b>Top UK Commodities vs. Illicit Drugs Market (£ Billions)</b>",
+        showlegend=False, 
+        height=600, # Increased height for vertical breathing room
+
+        # X-Axis Styling (The Categories)
+        xaxis=dict(
+            title=None,
+            tickangle=-45 # Angle labels to prevent overlapping
         ),
-        tickangle=-45 # Angle labels to prevent overlapping
-    ),
-    
-    # Y-Axis Styling (The Numbers)
-    yaxis=dict(
-        title=dict(text="<b>Value (£ Billions)</b>", font=dict(size=16)),
-        tickfont=dict(size=14),
-        showgrid=True,
-        gridcolor='lightgray'
+
+        # Y-Axis Styling (The Numbers)
+        yaxis=dict(
+            title=dict(text="<b>Value (£ Billions)</b>", font=dict(size=16)),
+            tickfont=dict(size=14),
+            showgrid=True,
+            gridcolor='lightgray'
+        )
     )
-)
 
-# 5. Update Bar Text (The numbers on top of bars)
-fig_imports.update_traces(
-    texttemplate='<b>£%{text}B</b>', # <b> tag makes it bold
-    textposition='outside',
-    textfont=dict(
-        size=18, # Significantly larger
-        family="Arial Black"
-    ),
-    cliponaxis=False # Ensures top labels don't get cut off
-)
+    # 4. Update Bar Text (The numbers on top of bars)
+    fig_imports.update_traces(
+        texttemplate='<b>£%{text}B</b>', # <b> tag makes it bold
+        textposition='outside',
+        textfont=dict(
+            size=18 # Significantly larger
+        ),
+        cliponaxis=False, # Ensures top labels don't get cut off
+        hoverinfo="skip", # Static chart: the labels already show every value
+        hovertemplate=None
+    )
+    fig_imports.update_layout(
+        modebar_remove=["lasso", "select", "autoscale", "resetScale", "pan", "zoom", "zoomIn", "zoomOut"]
+    )
+
+    return fig_imports
+
+@st.fragment
+def economic_scale_section():
+    """
+    Imports chart and reveal/reset buttons.
+    Runs as a fragment so toggling the reveal only reruns this section.
+    """
+    # Keep the same figure object across reruns until the reveal state changes
+    reveal = st.session_state['reveal_drug_market']
+    if 'fig_imports' not in st.session_state or st.session_state.get('_fig_imports_reveal') != reveal:
+        st.session_state['fig_imports'] = build_imports_fig(reveal)
+        st.session_state['_fig_imports_reveal'] = reveal
+
+    # Render Chart
+    # Rendered as a static plot: nothing to interact with, so Plotly.js skips event wiring
+    st.plotly_chart(
+        st.session_state['fig_imports'], use_container_width=True, key="imports_fig",
+        config={"staticPlot": True, "displayModeBar": False}
+    )
+
+    # Render Button
+    col_btn, col_space = st.columns([1, 4])
+    with col_btn:
+        if not st.session_state['reveal_drug_market']:
+            st.button("⚠️ Reveal Illicit Market Scale", on_click=set_drug_market_reveal, args=(True,))
+        else:
+            st.button("Reset Chart", on_click=set_drug_market_reveal, args=(False,))
+
+economic_scale_section()
 
-# Render Chart
-st.plotly_chart(fig_imports, use_container_width=True)
-
-# Render Button
-col_btn, col_space = st.columns([1, 4])
-with col_btn:
-    if not st.session_state['reveal_drug_market']:
-        if st.button("⚠️ Reveal Illicit Market Scale"):
-            st.session_state['reveal_drug_market'] = True
-            st.rerun()
-    else:
-        if st.button("Reset Chart"):
-            st.session_state['reveal_drug_market'] = False
-            st.rerun()
 url = "https://www.independent.co.uk/news/uk/crime/russia-war-money-laundering-uk-operation-destabilise-keremet-b2869448.html"
 
 st.markdown(f"""
@@ -693,18 +821,15 @@ st.markdown("---")
 # -----------------------------------------------------------------------------
 st.header("📊 Incidents by Location and Type (Top 20 Locations)")
 
-if not df_incidents.empty:
-    # 1. Calculate Totals to find the ACTUAL Top 20
-    # Sort Ascending so .tail(20) grabs the largest values
-    location_totals = df_incidents.groupby("Location")["Count"].sum().sort_values(ascending=True)
-    
-    # 2. Get Top 20 Locations
-    top_locations = location_totals.tail(20).index.tolist()
-    
-    # 3. Filter main dataframe
-    df_filtered = df_incidents[df_incidents["Location"].isin(top_locations)]
-    
-    # 4. Custom Color Map (Kept as requested)
+@st.cache_data(show_spinner=False)
+def build_incident_fig(df_filtered, top_locations, total_count):
+    """
+    Builds the stacked incident chart for the top 20 locations.
+    Expects the output of top20_incidents.
+    """
+    import plotly.express as px
+
+    # 1. Custom Color Map (Kept as requested)
     custom_colors = {
         "Drug Users/Dealers": "#DC3912",  # Red
         "Youths": "#FF9900",              # Orange
@@ -717,7 +842,7 @@ if not df_incidents.empty:
         "Drinking/Drunk": "#66AA00"       # Light Green
     }
 
-    # 5. Create Chart
+    # 2. Create Chart
     fig_advanced = px.bar(
         df_filtered,
         x="Count",
@@ -725,16 +850,16 @@ if not df_incidents.empty:
         color="Category",
         orientation='h',
         text="Count", # This adds the number inside the bar
-        title=f"<b>Total Incidents: {df_incidents['Count'].sum()}</b>", # Bold Title
+        title=f"<b>Total Incidents: {total_count}</b>", # Bold Title
         color_discrete_map=custom_colors,
+        template=camden_plotly_template(), # Shared fonts and bar gap
         # Ensure the largest bars are at the top visual position
         category_orders={"Location": top_locations} 
     )
 
-    # 6. Advanced Styling
+    # 3. Advanced Styling
     fig_advanced.update_layout(
         height=800, # Taller to accommodate thicker bars
-        bargap=0.15, # <--- This makes the columns/bars THICKER (closer to 0 is thicker)
         barmode='stack', # Ensures bars collapse when items are removed via legend
         
         # Legend Styling
@@ -747,13 +872,9 @@ if not df_incidents.empty:
             font=dict(size=14)
         ),
         
-        # Global Font
-        font=dict(family="Arial", size=14, color="black"),
-        
         # X-Axis (Numbers)
         xaxis=dict(
             title="<b>Number of Incidents</b>",
-            tickfont=dict(size=14, family="Arial Black"),
             showgrid=True, 
             gridcolor='lightgray'
         ),
@@ -768,19 +889,26 @@ if not df_incidents.empty:
         )
     )
     
-    # 7. Style the numbers inside the bars
+    # 4. Style the numbers inside the bars
     fig_advanced.update_traces(
         texttemplate='%{text}', 
         textposition='inside',
         insidetextanchor='middle',
         textfont=dict(
-            family="Arial Black",
             size=14,
             color="white" # White text on colored bars for contrast
         )
     )
-    
-    st.plotly_chart(fig_advanced, use_container_width=True)
+
+    return fig_advanced
+
+if not df_incidents.empty:
+    # Keep the same figure object across reruns until the data files change
+    if 'fig_advanced' not in st.session_state or st.session_state.get('_fig_advanced_mtimes') != data_mtimes:
+        st.session_state['fig_advanced'] = build_incident_fig(df_top_incidents, top_locations, total_incidents)
+        st.session_state['_fig_advanced_mtimes'] = data_mtimes
+
+    st.plotly_chart(st.session_state['fig_advanced'], use_container_width=True, key="incident_fig")
 else:
     st.warning("No data available for analysis.")
 
@@ -794,64 +922,58 @@ st.markdown("---")
 
 st.header("🔄 The Cycle of Supply & Local Impact")
 
+# Static DOT source for the supply-cycle diagram (previously assembled with graphviz.Digraph)
+CYCLE_DOT = r"""
+digraph {
+    // --- COMPACT GRAPH STYLING ---
+    newrank=true rankdir=TB
+    splines=curved      // Curved lines look cleaner and take less space
+    nodesep=0.3         // Reduce space between nodes width-wise
+    ranksep=0.4         // Reduce space between levels height-wise
+    bgcolor=transparent
+
+    // Node Style (Smaller and sharper), Camden Navy
+    node [fillcolor="#0e1b3c" fontcolor=white fontname=Arial fontsize=10 height=0.4 margin="0.1,0.1" shape=box style="filled, rounded"]
+
+    // --- NODES ---
+    A [label="1. Providers"]
+    B [label="2. Distributors"]
+    C [label="3. The Market\n(Hub)"]
+    D [label="4. Buyers"]
+    E [label="5. Reinforcement"]
+
+    // Impact Node (Red)
+    node [fillcolor="#d92828" fontcolor=white]
+    Impact [label="SOCIAL IMPACT:\nRough Sleepers,\nbeggars, thieves, \nand those involved \nin violent crime"]
+
+    // Cost Node (Yellow)
+    node [fillcolor="#ffcc00" fontcolor=black]
+    Cost [label="£ Council Costs\n& Crime Rates"]
+
+    // --- EDGES ---
+    edge [arrowsize=0.6 color="#555555" penwidth=1.2]
+
+    // Main Cycle
+    A -> B
+    B -> C
+    C -> D
+    D -> E
+    E -> A
+
+    // Consequences (Dotted)
+    edge [color="#d92828" style=dashed]
+    D -> Impact
+    E -> Cost
+    Impact -> Cost
+}
+"""
+
 # 1. Layout: Equal columns (1:1) and Vertically Centered
 col_diagram, col_text = st.columns([1, 1], gap="large", vertical_alignment="center")
 
 with col_diagram:
-    # Initialize Graphviz
-    dot = graphviz.Digraph(comment='Drug Market Cycle')
-    
-    # --- COMPACT GRAPH STYLING ---
-    # rankdir='LR' (Left-to-Right) often fits presentations better than Top-Bottom
-    # newrank='true' helps align nodes better
-    dot.attr(rankdir='TB', newrank='true') 
-    dot.attr(splines='curved') # Curved lines look cleaner and take less space
-    dot.attr(nodesep='0.3')    # Reduce space between nodes width-wise
-    dot.attr(ranksep='0.4')    # Reduce space between levels height-wise
-    dot.attr(bgcolor='transparent')
-    
-    # Node Style (Smaller and sharper)
-    dot.attr('node', shape='box', style='filled, rounded', 
-             fillcolor='#0e1b3c', # Camden Navy
-             fontcolor='white', 
-             fontname='Arial', 
-             fontsize='10',       # Smaller font
-             margin='0.1,0.1',    # Tighter margins inside boxes
-             height='0.4')
-
-    # --- NODES ---
-    # Using shorter labels to keep boxes small
-    dot.node('A', '1. Providers')
-    dot.node('B', '2. Distributors')
-    dot.node('C', '3. The Market\n(Hub)')
-    dot.node('D', '4. Buyers')
-    dot.node('E', '5. Reinforcement')
-
-    # Impact Node (Red)
-    dot.attr('node', fillcolor='#d92828', fontcolor='white')
-    dot.node('Impact', 'SOCIAL IMPACT:\nRough Sleepers,\nbeggars, thieves, \nand those involved \nin violent crime')
-
-    # Cost Node (Yellow)
-    dot.attr('node', fillcolor='#ffcc00', fontcolor='black')
-    dot.node('Cost', '£ Council Costs\n& Crime Rates')
-
-    # --- EDGES ---
-    dot.attr('edge', color='#555555', arrowsize='0.6', penwidth='1.2')
-    
-    # Main Cycle
-    dot.edge('A', 'B')
-    dot.edge('B', 'C')
-    dot.edge('C', 'D')
-    dot.edge('D', 'E')
-    dot.edge('E', 'A')
-
-    # Consequences (Dotted)
-    dot.attr('edge', style='dashed', color='#d92828')
-    dot.edge('D', 'Impact')
-    dot.edge('E', 'Cost')
-    dot.edge('Impact', 'Cost')
     # Render with a specific height/width constraint via Streamlit
-    st.graphviz_chart(dot, use_container_width=True)
+    st.graphviz_chart(CYCLE_DOT, use_container_width=True)
 
 with col_text:
     # --- TEXT CONTENT ---
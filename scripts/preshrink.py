@@ -0,0 +1,40 @@
+"""
+Pre-shrinks the slide images to their display size as WebP.
+
+Writes `<name>.webp` next to each source PNG, sized and encoded by
+`render_webp` in slide_images.py. The app sends these copies to the browser
+as WebP data URLs, so no resampling or re-encoding happens on the request
+path.
+
+Run from the repository root after replacing any of the PNGs:
+    python scripts/preshrink.py
+"""
+import os
+import sys
+
+# Run as a script from scripts/, so make the repository root importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from slide_images import IMAGES, render_webp, webp_path  # noqa: E402
+
+
+def preshrink(image_path):
+    """
+    Writes the WebP copy of one image and returns its path.
+    Renders before touching the output and swaps it in atomically, so a failed run never
+    leaves an empty or partial .webp that is newer than its PNG.
+    """
+    data = render_webp(image_path)
+    if data is None:
+        raise FileNotFoundError(f"{image_path} not found")
+    out_path = webp_path(image_path)
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, out_path)
+    return out_path
+
+
+if __name__ == "__main__":
+    for path in IMAGES:
+        print(f"{path} -> {preshrink(path)}")
@@ -0,0 +1,89 @@
+"""
+Display sizes and WebP encoding for the slide images.
+
+Shared by app.py, which renders an image with `render_webp` when its .webp
+copy is missing or older than the PNG, and scripts/preshrink.py, which
+writes those copies ahead of time, so both produce the same bytes:
+  * the evidence images are cropped to matching 600x400 tiles;
+  * every other image keeps its aspect ratio and is only scaled down to
+    fit within 1200x800;
+  * the section 6 header icon, shown inline at 40x40, is scaled down to
+    fit within 120x120.
+
+Resizing uses pic-scale's SIMD Lanczos.
+"""
+import io
+import os
+
+# PIL and pic-scale are imported inside the functions that use them, so importing
+# the tables below stays cheap for app.py
+
+# Evidence images shown side by side in section 6
+FIT_IMAGES = {"6.png": (600, 400), "7.png": (600, 400)}
+MAX_SIZE = (1200, 800)
+# Title logo, station photos, market photo, map and the section 6 header icon
+BOUNDED_IMAGES = {
+    "1.png": MAX_SIZE, "2.png": MAX_SIZE, "3.png": MAX_SIZE, "4.png": MAX_SIZE,
+    "5.png": MAX_SIZE, "8.png": MAX_SIZE, "ju.png": (120, 120),
+}
+IMAGES = [*FIT_IMAGES, *BOUNDED_IMAGES]
+WEBP_QUALITY = 85
+
+
+def webp_path(image_path):
+    """Returns the file name used for the WebP copy of an image."""
+    return os.path.splitext(image_path)[0] + ".webp"
+
+
+def resize(img, size, workers=0):
+    """Lanczos resize to an exact size with pic-scale. workers=0 uses every core."""
+    import pic_scale
+
+    if img.mode not in ("L", "LA", "RGB", "RGBA", "I;16", "F"):
+        img = img.convert("RGBA")
+    return pic_scale.resize(img, size, pic_scale.Resampling.LANCZOS, workers=workers)
+
+
+def bounded_size(size, max_size=MAX_SIZE):
+    """Scales (w, h) down to fit within max_size, keeping the aspect ratio. Never upscales."""
+    scale = min(max_size[0] / size[0], max_size[1] / size[1], 1)
+    return max(1, round(size[0] * scale)), max(1, round(size[1] * scale))
+
+
+def center_crop(img, aspect_size):
+    """Crops the largest centred box with aspect_size's aspect ratio, like ImageOps.fit."""
+    src_w, src_h = img.size
+    ratio = aspect_size[0] / aspect_size[1]
+    if src_w / src_h > ratio:
+        crop_w = round(src_h * ratio)
+        left = (src_w - crop_w) // 2
+        return img.crop((left, 0, left + crop_w, src_h))
+    crop_h = round(src_w / ratio)
+    top = (src_h - crop_h) // 2
+    return img.crop((0, top, src_w, top + crop_h))
+
+
+def render_webp(image_path, workers=0):
+    """
+    Returns the display-sized WebP bytes for one of IMAGES, or None if the file is missing.
+    Images already at their display size are encoded without resampling.
+    """
+    from PIL import Image
+
+    if not os.path.exists(image_path):
+        return None
+    with Image.open(image_path) as img:
+        if image_path in FIT_IMAGES:
+            fit_size = FIT_IMAGES[image_path]
+            if img.size != fit_size:
+                img = resize(center_crop(img, fit_size), fit_size, workers)
+        else:
+            target = bounded_size(img.size, BOUNDED_IMAGES[image_path])
+            if target != img.size:
+                img = resize(img, target, workers)
+        # WebP supports transparency, so only palette/greyscale images need converting
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA")
+        buf = io.BytesIO()
+        img.save(buf, "WEBP", quality=WEBP_QUALITY, method=6)
+    return buf.getvalue()